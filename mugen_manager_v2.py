@@ -1,11 +1,17 @@
 import os
+import bisect
 import shutil
 import zipfile
-import rarfile
-import py7zr
 import sys
 import json
+import time
+import inspect
+import functools
+import tempfile
+import threading
 import traceback
+import concurrent.futures
+import multiprocessing
 from datetime import datetime
 
 # ==============================================================================
@@ -16,6 +22,47 @@ from datetime import datetime
 # - Smarter logic and cleaner UI
 # ==============================================================================
 
+_ARCHIVE_EXTS = ('.zip', '.rar', '.7z')
+_DEF_EXT = '.def'
+
+# rarfile and py7zr drag in heavy dependency trees (cryptography, zstandard,
+# ...) and most menu actions never touch an archive, so they are imported on
+# first use and cached in these module globals.
+rarfile = None
+py7zr = None
+
+def _ensure_rarfile():
+    global rarfile
+    if rarfile is None:
+        import rarfile
+    return rarfile
+
+def _ensure_py7zr():
+    global py7zr
+    if py7zr is None:
+        import py7zr
+    return py7zr
+
+try:
+    import orjson  # optional: much faster JSON parse/serialize when available
+except ImportError:
+    orjson = None
+
+def _json_load(path):
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read().lstrip(b'\xef\xbb\xbf'))
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return json.load(f)
+
+def _json_dump(data, path):
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4)
+
 def log_error_and_exit(e):
     base_path = get_base_path()
     log_file_path = os.path.join(base_path, 'crash_log.txt')
@@ -26,7 +73,9 @@ def log_error_and_exit(e):
     input("\nPress Enter to exit.")
     sys.exit(1)
 
+@functools.lru_cache(maxsize=1)
 def get_base_path():
+    # Pure, but abspath can touch the filesystem on Windows, so cache it.
     if getattr(sys, 'frozen', False): return os.path.dirname(sys.executable)
     else: return os.path.dirname(os.path.abspath(__file__))
 
@@ -39,141 +88,446 @@ def load_or_create_config(config_path):
     if not os.path.exists(config_path):
         print("-> config.json not found. Creating a default one now.")
         print(f"   Please edit '{config_path}' with your correct paths and re-run.")
-        with open(config_path, 'w', encoding='utf-8') as f: json.dump(default_config, f, indent=4)
+        _json_dump(default_config, config_path)
         return None
     try:
-        with open(config_path, 'r', encoding='utf-8-sig') as f: return json.load(f)
-    except Exception as e:
+        config_data = _json_load(config_path)
+    except (OSError, ValueError) as e:  # ValueError covers json/orjson decode errors
         print(f"ERROR: Could not load '{config_path}'. {e}"); return None
+    # Set difference on the dict-keys views: one C-level subset check.
+    missing = default_config.keys() - config_data.keys()
+    if missing:
+        print(f"Warning: config.json is missing keys: {', '.join(sorted(missing))}. Using defaults for them.")
+        for key in missing: config_data[key] = default_config[key]
+    return config_data
+
+# Roster writes are atomic (tempfile + os.replace), so the .bak file is a
+# rolling safety snapshot rather than crash protection -- one copy per session
+# is enough instead of a whole-file copy before every single write.
+_backed_up_this_session = set()
+
+def _fast_copy(src, dst):
+    """Back up via hard link when the filesystem allows it: O(1) and zero
+    extra bytes. Safe because select.def is only ever replaced atomically,
+    never rewritten in place, so the link keeps pointing at the old content.
+    Falls back to a real copy (FAT/exFAT, network shares, cross-volume)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
 def backup_roster(roster_path):
+    if roster_path in _backed_up_this_session: return True
     try:
         backup_dir = os.path.join(os.path.dirname(roster_path), 'backups')
         os.makedirs(backup_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         backup_file = os.path.join(backup_dir, f"select.def.{timestamp}.bak")
-        shutil.copy2(roster_path, backup_file)
+        _fast_copy(roster_path, backup_file)
         print(f"-> Backup created: {os.path.basename(backup_file)}")
+        _backed_up_this_session.add(roster_path)
         return True
-    except Exception as e:
+    except OSError as e:
         print(f"Warning: Could not create a backup of select.def. Reason: {e}")
         return False
 
+# Parsed sections keyed by roster path; entries are (stat key, {section: list})
+# so unchanged files cost one os.stat per read instead of a full re-parse.
+_roster_cache = {}
+
 def read_roster(roster_path, section_name):
-    items = []
-    if not os.path.exists(roster_path): return []
     try:
-        with open(roster_path, 'r', encoding='utf-8-sig', errors='ignore') as f:
-            in_section = False
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith(';'): continue
-                if line.lower() == f'[{section_name.lower()}]': in_section = True; continue
-                if line.startswith('['): in_section = False
-                if in_section:
-                    item_name = line.split(',')[0].strip()
-                    if item_name and item_name.lower() != 'randomselect':
-                        items.append(item_name)
-    except Exception as e:
-        print(f"Warning: Could not read {section_name}. Reason: {e}")
-    return sorted(list(set(items)))
+        st = os.stat(roster_path)
+    except OSError:
+        return []
+    stat_key = (st.st_mtime_ns, st.st_size)
+    cached = _roster_cache.get(roster_path)
+    if not (cached and cached[0] == stat_key):
+        cached = (stat_key, _parse_all_sections(roster_path))
+        _roster_cache[roster_path] = cached
+    # copy: callers mutate their roster
+    return list(cached[1].get(section_name.lower(), []))
+
+def _parse_all_sections(roster_path):
+    """One pass over select.def binning entries per section header.
+
+    Callers like add_characters need both Characters and ExtraStages, so a
+    single read populates every section at once (keys lowercased). Lines are
+    kept as bytes and only the entry names actually stored get decoded.
+    """
+    sections = {}
+    try:
+        with open(roster_path, 'rb') as f:
+            data = f.read()
+        if data.startswith(b'\xef\xbb\xbf'): data = data[3:]
+        current = None
+        for raw in data.splitlines():
+            raw = raw.strip()
+            if not raw or raw.startswith(b';'): continue
+            if raw.startswith(b'['):
+                end = raw.find(b']')
+                if end > 1:
+                    current = sections.setdefault(raw[1:end].strip().lower().decode('utf-8', 'ignore'), [])
+                else:
+                    current = None
+                continue
+            if current is None: continue
+            item_name = raw.split(b',', 1)[0].strip()
+            if item_name and item_name.lower() != b'randomselect':
+                current.append(item_name.decode('utf-8', 'ignore'))
+    except OSError as e:
+        print(f"Warning: Could not read {roster_path}. Reason: {e}")
+    # Dedupe and sort once at parse time; every later consumer (display,
+    # writes, bisect insertions) relies on the lists staying sorted.
+    return {name: sorted(dict.fromkeys(items)) for name, items in sections.items()}
+
+# Raw select.def lines keyed the same way as _roster_cache, so write_roster
+# can skip its read pass when the file hasn't changed since the last write.
+_roster_lines_cache = {}
+
+def _read_roster_lines(roster_path):
+    try:
+        st = os.stat(roster_path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stat_key = None
+    cached = _roster_lines_cache.get(roster_path)
+    if stat_key and cached and cached[0] == stat_key:
+        return cached[1]
+    with open(roster_path, 'r', encoding='utf-8-sig', errors='ignore', buffering=1 << 20) as f:
+        lines = f.readlines()
+    if stat_key:
+        _roster_lines_cache[roster_path] = (stat_key, lines)
+    return lines
 
 def write_roster(roster_path, char_list, stage_list):
     try:
-        with open(roster_path, 'r', encoding='utf-8-sig', errors='ignore') as f: lines = f.readlines()
-        
-        with open(roster_path, 'w', encoding='utf-8') as f:
-            in_chars, in_stages = False, False
-            for line in lines:
-                stripped_line = line.strip().lower()
-                # Handle Characters section
-                if stripped_line == '[characters]':
-                    f.write(line)
-                    for char in sorted(char_list): f.write(f"{char}\n")
-                    f.write("randomselect\n")
-                    in_chars = True
-                elif in_chars and (stripped_line.startswith('[') or not line.strip()):
-                    in_chars = False
-                    f.write(line)
-                # Handle ExtraStages section
-                elif stripped_line == '[extrastages]':
-                    f.write(line)
-                    for stage in sorted(stage_list): f.write(f"{stage}\n")
-                    in_stages = True
-                elif in_stages and (stripped_line.startswith('[') or not line.strip()):
-                    in_stages = False
-                    f.write(line)
-                # Write all other lines
-                elif not in_chars and not in_stages:
-                    f.write(line)
+        lines = _read_roster_lines(roster_path)
+
+        # Assemble the whole new file in memory, then write it in one shot to a
+        # temp file in the same directory and atomically swap it in. A crash
+        # mid-write leaves the old select.def untouched.
+        out = []
+        in_chars, in_stages = False, False
+        wrote_chars, wrote_stages = False, False
+        for line in lines:
+            stripped_line = line.strip().lower()
+            # Handle Characters section
+            if stripped_line == '[characters]':
+                out.append(line)
+                # Roster lists are sorted on parse and kept sorted via insort,
+                # so no re-sort is needed here.
+                out.extend(f"{char}\n" for char in char_list)
+                out.append("randomselect\n")
+                in_chars, wrote_chars = True, True
+            elif in_chars and (stripped_line.startswith('[') or not line.strip()):
+                in_chars = False
+                out.append(line)
+            # Handle ExtraStages section
+            elif stripped_line == '[extrastages]':
+                out.append(line)
+                out.extend(f"{stage}\n" for stage in stage_list)
+                in_stages, wrote_stages = True, True
+            elif in_stages and (stripped_line.startswith('[') or not line.strip()):
+                in_stages = False
+                out.append(line)
+            # Write all other lines
+            elif not in_chars and not in_stages:
+                out.append(line)
+
+        tmp_path = roster_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(''.join(out))
+        os.replace(tmp_path, roster_path)
+        # Write-through: refill the caches from what was just written so the
+        # next read costs one os.stat instead of a re-parse.
+        try:
+            st = os.stat(roster_path)
+            stat_key = (st.st_mtime_ns, st.st_size)
+            prior = _roster_cache.get(roster_path)
+            if prior and wrote_chars and wrote_stages:
+                # Other sections pass through the rewrite untouched, so keep
+                # their previously parsed entries alongside the new lists.
+                sections = dict(prior[1])
+                sections["characters"] = list(dict.fromkeys(char_list))
+                sections["extrastages"] = list(dict.fromkeys(stage_list))
+                _roster_cache[roster_path] = (stat_key, sections)
+            else:
+                # A missing section header means its entries were never
+                # emitted to the file; force a re-parse rather than caching
+                # lists the file doesn't contain.
+                _roster_cache.pop(roster_path, None)
+            _roster_lines_cache[roster_path] = (stat_key, out)
+        except OSError:
+            _roster_cache.pop(roster_path, None)
+            _roster_lines_cache.pop(roster_path, None)
         return True
-    except Exception as e:
+    except OSError as e:
         print(f"ERROR: Could not write to select.def. Reason: {e}")
         return False
 
-def list_items(items, item_type):
-    print(f"\n--- Currently Installed {item_type} ---")
+def _simple_name(entry):
+    """First path component of a roster entry, e.g. 'team/Ken' -> 'team'.
+
+    One partition instead of the replace+split+index chain, and the replace
+    only runs when a backslash is actually present.
+    """
+    if '\\' in entry: entry = entry.replace('\\', '/')
+    head, _, _ = entry.partition('/')
+    return head
+
+def _present_dirs(folder):
+    """Names of the subdirectories of folder, lowercased, in one scandir pass."""
+    try:
+        with os.scandir(folder) as it:
+            return {e.name.lower() for e in it if e.is_dir(follow_symlinks=False)}
+    except OSError:
+        return set()
+
+def list_items(items, item_type, folder=None):
+    # One joined write instead of a print per entry; on Windows consoles each
+    # print is its own syscall, which crawls on thousand-entry rosters.
+    # When a folder is given, its contents are read once up front so the
+    # per-entry status check is a set lookup rather than a stat syscall.
+    present = _present_dirs(folder) if folder else None
+    lines = [f"\n--- Currently Installed {item_type} ---"]
     if not items:
-        print(f"No {item_type.lower()} found in roster file."); return
+        lines.append(f"No {item_type.lower()} found in roster file.")
+    # Roster lists arrive pre-sorted from read_roster, so the numbering here
+    # matches the caller's list indices with no extra sort.
     for i, item in enumerate(items, 1):
         # A bit of smart formatting for complex paths
         display_name = item.replace('\\', '/').split('/')[-1]
         full_path = "" if display_name == item else f"({item})"
-        print(f"{i: >3}. {display_name.ljust(30)} {full_path}")
+        status = ""
+        if present is not None:
+            status = "[OK]" if _simple_name(item).lower() in present else "[FOLDER MISSING]"
+        lines.append(f"{i: >3}. {display_name.ljust(30)} {full_path}{status}")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 # --- Add/Delete functions refactored for new logic ---
 
+def _fast_rmtree(path):
+    """Rename the tree out of the way, then delete it on a background thread.
+
+    The rename is instant, so the caller can move on to the next archive while
+    the disk churns through the actual unlinks. Falls back to a synchronous
+    rmtree when the rename itself fails.
+    """
+    trash = f"{path}.trash-{os.getpid()}-{time.time_ns()}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True}, daemon=True).start()
+
+def _sweep_stale_staging(chars_folder):
+    """Delete staging dirs left behind by earlier runs.
+
+    The background trash deletions above run on daemon threads, so exiting
+    right after an install can strand .__mugen_session_* dirs (including
+    their .trash-* renames) inside the game's chars folder. Clearing them
+    synchronously here keeps the folder from accumulating dead trees.
+    """
+    try:
+        with os.scandir(chars_folder) as it:
+            stale = [e.path for e in it
+                     if e.name.startswith('.__mugen_session_') and e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+def peek_top_folder(archive_path):
+    """Read an archive's single top-level folder name from its table of contents.
+
+    Costs one directory/central-directory read instead of a full extraction +
+    tree walk, which lets callers skip archives for characters that are
+    already installed. Returns None for corrupt archives or ones without a
+    single root folder.
+    """
+    try:
+        kind = _detect_archive_kind(archive_path)
+        if kind == 'zip':
+            with zipfile.ZipFile(archive_path, 'r') as z: names = z.namelist()
+        elif kind == 'rar':
+            with _ensure_rarfile().RarFile(archive_path, 'r') as r: names = r.namelist()
+        elif kind == '7z':
+            with _ensure_py7zr().SevenZipFile(archive_path, 'r') as s: names = s.getnames()
+        else:
+            return None
+    except _archive_error_types():
+        return None
+    names = [n.replace('\\', '/') for n in names]
+    roots = {n.split('/', 1)[0] for n in names if n.strip('/')}
+    if len(roots) == 1:
+        root = roots.pop()
+        if any(n.startswith(f"{root}/") for n in names):
+            return root
+        return None
+    # Archives with readmes/previews next to the character folder: fall back
+    # to the folder whose subtree holds a .def file, if there is exactly one.
+    def_roots = {n.split('/', 1)[0] for n in names if '/' in n and n.lower().endswith(_DEF_EXT)}
+    if len(def_roots) == 1:
+        return def_roots.pop()
+    return None
+
+def _extract_one(archive_name, archive_path, staging_root, top_hint=None):
+    """Worker for the extraction pool: unpack one archive into its own temp dir.
+
+    staging_root lives inside the chars folder so the final move is a rename
+    on the same volume, never a recursive copy. top_hint is the folder name
+    already peeked from the archive listing, if any. Returns (archive_name,
+    archive_path, temp_dir, char_folder_name); temp_dir is None when
+    extraction failed. The caller owns cleanup of temp_dir.
+    """
+    temp_extract = tempfile.mkdtemp(prefix='.__tmp_extract_', dir=staging_root)
+    if not extract_archive(archive_path, temp_extract, only_prefix=top_hint):
+        _fast_rmtree(temp_extract)
+        return (archive_name, archive_path, None, None)
+    char_folder_name = top_hint or find_character_folder(temp_extract)
+    return (archive_name, archive_path, temp_extract, char_folder_name)
+
+def _extraction_results(pending, session_tmp):
+    """Yield _extract_one results, in completion order when pooled.
+
+    A single archive runs in-process: spawning a worker interpreter costs
+    more than it saves when there is only one task to run.
+    """
+    if len(pending) == 1:
+        name, path, top = pending[0]
+        yield _extract_one(name, path, session_tmp, top)
+        return
+    workers = min(len(pending), os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_extract_one, name, path, session_tmp, top)
+                   for name, path, top in pending]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
 def add_characters(roster_path, chars_folder, downloads_path, cleanup):
     # ... (This logic is fine, we just update the final call)
-    archives = [f for f in os.listdir(downloads_path) if f.endswith(('.zip', '.rar', '.7z'))]
+    _sweep_stale_staging(chars_folder)
+    # scandir gives us file-type info and the full path without extra stat calls
+    with os.scandir(downloads_path) as it:
+        archives = [(e.name, e.path) for e in it
+                    if e.is_file(follow_symlinks=False) and e.name.lower().endswith(_ARCHIVE_EXTS)]
     if not archives: print("\nNo new character archives found."); return
-    
+
     char_roster = read_roster(roster_path, "Characters")
     stage_roster = read_roster(roster_path, "ExtraStages")
     newly_added_chars = []
+    # Normalized once so the per-archive duplicate check is a hash lookup
+    # instead of rebuilding a lowercased list for every archive.
+    installed_simple = {_simple_name(r).lower() for r in char_roster}
 
-    for archive_name in archives:
-        print(f"\n--- Installing: {archive_name} ---")
-        archive_path = os.path.join(downloads_path, archive_name)
-        temp_extract = os.path.join(get_base_path(), '_temp_extract')
-        if os.path.exists(temp_extract): shutil.rmtree(temp_extract)
-        os.makedirs(temp_extract)
+    # Extraction (deflate/LZMA) is CPU-heavy and independent per archive, so it
+    # runs across a process pool. Everything that touches shared state -- the
+    # move into chars/, the roster list, archive cleanup -- stays on the main
+    # process and is handled as each extraction completes.
+    # The roster is read once up front and written once at the end; the
+    # try/finally makes sure characters already moved into chars/ still get
+    # their select.def entries even if a later archive blows up mid-batch.
+    # Stage extractions inside the chars folder itself so the final move is an
+    # atomic same-volume rename instead of shutil's copy+delete fallback when
+    # downloads and the game live on different drives.
+    try:
+        if os.stat(downloads_path).st_dev != os.stat(chars_folder).st_dev:
+            print("-> Downloads and game folders are on different drives; staging extractions inside the chars folder.")
+    except OSError:
+        pass
+    # Archives already processed in an earlier run (same name/mtime/size) are
+    # remembered in a small JSON cache next to the script, so re-running over a
+    # full downloads folder doesn't even open them again.
+    cache_path = os.path.join(get_base_path(), '.archive_cache.json')
+    try:
+        archive_cache = _json_load(cache_path)
+        if not isinstance(archive_cache, dict): archive_cache = {}
+    except (OSError, ValueError):
+        archive_cache = {}
 
-        if not extract_archive(archive_path, temp_extract): continue
-        char_folder_name = find_character_folder(temp_extract)
-        if not char_folder_name: print("   ERROR: Could not identify a valid character folder. Skipping."); continue
-        
-        # Check against simple name
-        if char_folder_name.lower() in [r.lower().split('\\')[0].split('/')[0] for r in char_roster]:
-            print(f"   WARNING: '{char_folder_name}' seems to be already installed. Skipping."); continue
-
-        source_path = os.path.join(temp_extract, char_folder_name)
-        destination_path = os.path.join(chars_folder, char_folder_name)
-        if os.path.exists(destination_path):
-             print(f"   WARNING: Folder '{char_folder_name}' already exists. Skipping."); continue
-        shutil.move(source_path, chars_folder)
-        
-        char_roster.append(char_folder_name)
-        newly_added_chars.append(char_folder_name)
-        print(f"   '{char_folder_name}' successfully installed.")
-        
-        if cleanup: os.remove(archive_path)
-        shutil.rmtree(temp_extract)
-
-    if newly_added_chars:
-        print("\nUpdating select.def with new characters...")
-        if backup_roster(roster_path):
-            if write_roster(roster_path, char_roster, stage_roster):
-                print("Roster updated successfully.")
+    # Peek each archive's listing first: characters that are already installed
+    # never get extracted at all.
+    pending = []
+    cache_keys = {}
+    live_keys = set()
+    for archive_name, archive_path in archives:
+        try:
+            st = os.stat(archive_path)
+            cache_key = f"{archive_name}|{st.st_mtime_ns}|{st.st_size}"
+        except OSError:
+            cache_key = None
+        if cache_key:
+            live_keys.add(cache_key)
+            if archive_cache.get(cache_key, {}).get("installed"):
+                print(f"\n--- Skipping {archive_name}: already processed in a previous run. ---")
+                continue
+        top = peek_top_folder(archive_path)
+        if top and top.lower() in installed_simple:
+            print(f"\n--- Skipping {archive_name}: '{top}' is already installed. ---")
+            continue
+        cache_keys[archive_name] = cache_key
+        pending.append((archive_name, archive_path, top))
+    if not pending: print("\nNo new character archives found."); return
+
+    # One hidden scratch dir for the whole session; each worker gets a subdir
+    # inside it, and everything left behind (failed or skipped extractions) is
+    # torn down once at the end instead of a create/rmtree cycle per archive.
+    session_tmp = tempfile.mkdtemp(prefix='.__mugen_session_', dir=chars_folder)
+    try:
+        for result in _extraction_results(pending, session_tmp):
+            archive_name, archive_path, temp_extract, char_folder_name = result
+            print(f"\n--- Installing: {archive_name} ---")
+            if temp_extract is None: continue
+            if not char_folder_name: print("   ERROR: Could not identify a valid character folder. Skipping."); continue
+
+            # Check against simple name
+            if char_folder_name.lower() in installed_simple:
+                print(f"   WARNING: '{char_folder_name}' seems to be already installed. Skipping."); continue
+
+            source_path = os.path.join(temp_extract, char_folder_name)
+            destination_path = os.path.join(chars_folder, char_folder_name)
+            if os.path.exists(destination_path):
+                 print(f"   WARNING: Folder '{char_folder_name}' already exists. Skipping."); continue
+            try:
+                os.rename(source_path, destination_path)
+            except OSError:
+                shutil.move(source_path, destination_path)
+
+            bisect.insort(char_roster, char_folder_name)
+            installed_simple.add(char_folder_name.lower())
+            newly_added_chars.append(char_folder_name)
+            print(f"   '{char_folder_name}' successfully installed.")
+
+            if cleanup:
+                os.remove(archive_path)
+            elif cache_keys.get(archive_name):
+                archive_cache[cache_keys[archive_name]] = {"char": char_folder_name, "installed": True}
+    finally:
+        _fast_rmtree(session_tmp)
+        # Drop entries for archives that are gone or changed, then persist once.
+        archive_cache = {k: v for k, v in archive_cache.items() if k in live_keys}
+        try:
+            _json_dump(archive_cache, cache_path)
+        except OSError:
+            pass
+        if newly_added_chars:
+            print("\nUpdating select.def with new characters...")
+            if backup_roster(roster_path):
+                if write_roster(roster_path, char_roster, stage_roster):
+                    print("Roster updated successfully.")
+                else:
+                    print("ERROR: Roster update failed. Your old select.def is safe.")
             else:
-                print("ERROR: Roster update failed. Your old select.def is safe.")
-        else:
-            print("ERROR: Backup failed. Roster will not be modified for safety.")
+                print("ERROR: Backup failed. Roster will not be modified for safety.")
 
 def delete_character(roster_path, chars_folder):
     char_roster = read_roster(roster_path, "Characters")
     stage_roster = read_roster(roster_path, "ExtraStages")
-    list_items(char_roster, "Characters")
+    # Roster lists are already sorted, so the displayed numbering maps
+    # straight onto list indices and removal is a pop, not a scan.
+    list_items(char_roster, "Characters", folder=chars_folder)
     if not char_roster: return
     try:
         choice = int(input("\nEnter number of character to delete (0 to cancel): "))
@@ -187,10 +541,10 @@ def delete_character(roster_path, chars_folder):
 
     if backup_roster(roster_path):
         print(f"-> Removing '{char_to_delete}' from select.def...")
-        char_roster.remove(char_to_delete)
+        char_roster.pop(choice - 1)
         if write_roster(roster_path, char_roster, stage_roster):
             # Only delete the folder for simple entries to avoid mistakes
-            simple_name = char_to_delete.split('\\')[0].split('/')[0]
+            simple_name = _simple_name(char_to_delete)
             char_folder_path = os.path.join(chars_folder, simple_name)
             if os.path.isdir(char_folder_path):
                 print(f"-> Deleting folder: {char_folder_path}")
@@ -205,14 +559,15 @@ def add_stages(roster_path, stages_folder):
     print("\n--- Scanning for new stages ---")
     current_stages = read_roster(roster_path, "ExtraStages")
     # Get simple names for comparison, e.g. "stages/MyStage.def" -> "MyStage.def"
-    current_stage_names = [s.replace('\\', '/').split('/')[-1] for s in current_stages]
+    current_stage_names = {s.replace('\\', '/').split('/')[-1].lower() for s in current_stages}
     
-    found_stages = [f for f in os.listdir(stages_folder) if f.lower().endswith('.def')]
+    with os.scandir(stages_folder) as it:
+        found_stages = [e.name for e in it if e.is_file(follow_symlinks=False) and e.name.lower().endswith(_DEF_EXT)]
     newly_added_stages = []
 
     for stage_file in found_stages:
         if stage_file.lower() not in current_stage_names:
-            current_stages.append(f"stages/{stage_file}")
+            bisect.insort(current_stages, f"stages/{stage_file}")
             newly_added_stages.append(stage_file)
     
     if not newly_added_stages:
@@ -235,29 +590,114 @@ def add_stages(roster_path, stages_folder):
 # --- Helper functions (unchanged) ---
 def find_def_file(char_folder_path):
     char_folder_name = os.path.basename(char_folder_path)
-    if os.path.isfile(os.path.join(char_folder_path, f"{char_folder_name}.def")): return f"{char_folder_name}.def"
-    for file in os.listdir(char_folder_path):
-        if file.lower().endswith('.def'): return file
-    return None
+    # One scandir pass: prefer "<folder>.def", otherwise fall back to the first .def found.
+    fallback = None
+    with os.scandir(char_folder_path) as it:
+        for entry in it:
+            if not entry.is_file(): continue
+            if entry.name == f"{char_folder_name}{_DEF_EXT}": return entry.name
+            if fallback is None and entry.name.lower().endswith(_DEF_EXT): fallback = entry.name
+    return fallback
+
+_py7zr_mp_supported = None
+
+def _open_7z(archive_file):
+    """Open a 7z archive, enabling py7zr's parallel decompression when this
+    py7zr version accepts the mp flag. Probed once via the signature so older
+    versions keep working."""
+    global _py7zr_mp_supported
+    seven = _ensure_py7zr()
+    if _py7zr_mp_supported is None:
+        try:
+            _py7zr_mp_supported = 'mp' in inspect.signature(seven.SevenZipFile.__init__).parameters
+        except (TypeError, ValueError):
+            _py7zr_mp_supported = False
+    if _py7zr_mp_supported:
+        return seven.SevenZipFile(archive_file, 'r', mp=True)
+    return seven.SevenZipFile(archive_file, 'r')
 
-def extract_archive(archive_path, extract_to):
+_MAGIC_KINDS = ((b'PK\x03\x04', 'zip'), (b'Rar!\x1a\x07', 'rar'), (b"7z\xbc\xaf'\x1c", '7z'))
+
+def _detect_archive_kind(archive_path):
+    """Sniff the real format from the file magic.
+
+    Plenty of character packs circulate misnamed (a .rar that is actually a
+    zip), and extension dispatch then routes them to the wrong library. Falls
+    back to the extension when the header is unrecognized.
+    """
     try:
-        if archive_path.endswith('.zip'): with zipfile.ZipFile(archive_path, 'r') as z: z.extractall(extract_to)
-        elif archive_path.endswith('.rar'): with rarfile.RarFile(archive_path, 'r') as r: r.extractall(extract_to)
-        elif archive_path.endswith('.7z'): with py7zr.SevenZipFile(archive_path, 'r') as s: s.extractall(path=extract_to)
+        with open(archive_path, 'rb') as f:
+            head = f.read(6)
+        for magic, kind in _MAGIC_KINDS:
+            if head.startswith(magic): return kind
+    except OSError:
+        pass
+    ext = archive_path.lower().rsplit('.', 1)[-1]
+    return ext if ext in ('zip', 'rar', '7z') else None
+
+def _extract_zip_members(z, extract_to, only_prefix=None):
+    """extractall replacement streaming each member through 1 MiB buffers.
+
+    zipfile's own extraction copies in much smaller chunks, which for the
+    50-100 MB .sff sprite files inside character packs means a flood of tiny
+    write syscalls. Members that would escape extract_to are skipped, and
+    when only_prefix is set, so is everything outside that top-level folder
+    (readmes, previews, ...) -- those bytes are never written at all.
+    """
+    for info in z.infolist():
+        name = info.filename.replace('\\', '/')
+        # Reject absolute paths, parent traversal, and anything with a colon:
+        # a 'C:evil' segment makes os.path.join restart at a drive-relative
+        # path on Windows, escaping extract_to entirely.
+        if name.startswith('/') or '..' in name.split('/') or ':' in name: continue
+        if only_prefix and name.split('/', 1)[0] != only_prefix: continue
+        dest = os.path.join(extract_to, *name.split('/'))
+        if info.is_dir() or name.endswith('/'):
+            os.makedirs(dest, exist_ok=True)
+            continue
+        os.makedirs(os.path.dirname(dest) or extract_to, exist_ok=True)
+        with z.open(info) as src, open(dest, 'wb', buffering=1 << 20) as dst:
+            shutil.copyfileobj(src, dst, length=1 << 20)
+
+def _archive_error_types():
+    # rarfile/py7zr are imported lazily, so their exception classes can only be
+    # included once the corresponding module has actually been loaded.
+    types = [OSError, zipfile.BadZipFile]
+    if rarfile is not None: types.append(rarfile.Error)
+    if py7zr is not None: types.append(py7zr.exceptions.ArchiveError)
+    return tuple(types)
+
+def extract_archive(archive_path, extract_to, only_prefix=None):
+    # Archives are opened through a 1 MiB BufferedReader; the default 8 KiB
+    # buffer turns a big sprite pack into tens of thousands of tiny reads.
+    # only_prefix narrows zip extraction to one top-level folder; rar/7z
+    # extract in full since their libraries decompress solid streams anyway.
+    try:
+        kind = _detect_archive_kind(archive_path)
+        if kind == 'zip':
+            with open(archive_path, 'rb', buffering=1 << 20) as fh, zipfile.ZipFile(fh, 'r') as z:
+                _extract_zip_members(z, extract_to, only_prefix)
+        elif kind == 'rar':
+            # rarfile shells out to the unrar tool, which needs the real path
+            with _ensure_rarfile().RarFile(archive_path, 'r') as r:
+                r.extractall(extract_to)
+        elif kind == '7z':
+            with open(archive_path, 'rb', buffering=1 << 20) as fh, _open_7z(fh) as s:
+                s.extractall(path=extract_to)
         return True
-    except Exception as e:
+    except _archive_error_types() as e:
         print(f"   ERROR extracting {os.path.basename(archive_path)}: {e}"); return False
 
 def find_character_folder(base_path):
-    contents = os.listdir(base_path)
-    if not contents: return None
-    if len(contents) == 1 and os.path.isdir(os.path.join(base_path, contents[0])): return contents[0]
-    for item in contents:
-        item_path = os.path.join(base_path, item)
-        if os.path.isdir(item_path) and find_def_file(item_path): return item
-    potential_folders = [d for d in contents if os.path.isdir(os.path.join(base_path, d))]
-    if potential_folders: return potential_folders[0]
+    # Single directory read; DirEntry caches the is_dir result so we never re-stat.
+    with os.scandir(base_path) as it:
+        entries = list(it)
+    if not entries: return None
+    folders = [e for e in entries if e.is_dir(follow_symlinks=False)]
+    if len(entries) == 1 and folders: return folders[0].name
+    for folder in folders:
+        if find_def_file(folder.path): return folder.name
+    if folders: return folders[0].name
     return None
 
 def main_loop():
@@ -279,8 +719,13 @@ def main_loop():
     CHARS_FOLDER = os.path.join(GAME_PATH, 'chars')
     STAGES_FOLDER = os.path.join(GAME_PATH, 'stages')
 
+    # One shell call at startup flips the Windows console into VT mode; after
+    # that the ANSI clear below works in-process, with no subprocess spawn per
+    # menu iteration.
+    if os.name == 'nt': os.system('')
+
     while True:
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write('\x1b[2J\x1b[H'); sys.stdout.flush()
         print("\n MUGEN/IKEMEN GO Manager (select.def Edition) v5.0 ".center(60, "="))
         print("1. List Characters")
         print("2. Add New Character(s) from Downloads")
@@ -290,7 +735,7 @@ def main_loop():
         choice = input("Please choose an option (1-5): ")
         
         if choice == '1':
-            list_items(read_roster(roster_path, "Characters"), "Characters")
+            list_items(read_roster(roster_path, "Characters"), "Characters", folder=CHARS_FOLDER)
         elif choice == '2':
             add_characters(roster_path, CHARS_FOLDER, DOWNLOADS_PATH, config.get("CLEANUP_ARCHIVES_AFTER_ADD", True))
         elif choice == '3':
@@ -305,6 +750,7 @@ def main_loop():
         input("\nPress Enter to return to the menu...")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # needed for the extraction pool in frozen builds
     try:
         main_loop()
     except Exception as e: